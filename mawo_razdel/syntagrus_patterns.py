@@ -14,12 +14,43 @@ Optimized for:
 
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from re import Pattern
+from typing import Final
 
 
-@dataclass
+def _trie_regex(words: Iterable[str]) -> str:
+    """Builds a regex alternation for words with shared prefixes factored out.
+
+    Args:
+        words: Literal words to match
+
+    Returns:
+        Regex source matching exactly the given words
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}  # Конец слова
+
+    def render(node: dict[str, dict]) -> str:
+        optional = "" in node
+        branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if optional else "")
+
+    return render(trie)
+
+
+@dataclass(frozen=True, slots=True)
 class SegmentationRule:
     """Rule for sentence segmentation."""
 
@@ -30,6 +61,65 @@ class SegmentationRule:
     description: str
 
 
+# Паттерны рассчитаны на стандартный re и не переводятся на re2: re2 не поддерживает
+# lookaround'ы, а \b и \s в нем только ASCII (ломает кириллицу). Время работы линейно
+# и без re2: lookbehind (?<![.!?]) не дает перезапускать поиск внутри серии знаков,
+# а паттерны аббревиатур и инициалов применяются к окнам ограниченной длины.
+#
+# Каждое правило совпадает с ЦЕЛОЙ серией знаков [.!?] (lookbehind не дает начать
+# с середины серии) и заканчивается на ней - контекст проверяется lookahead'ом,
+# поэтому match.end() сразу дает позицию границы.
+_SEGMENTATION_RULES: Final[tuple[SegmentationRule, ...]] = (
+    # Priority 10: STRONG boundaries
+    # Sentence end followed by capital letter (русская ИЛИ латинская - для XXI, IV)
+    SegmentationRule(
+        name="sentence_end_capital",
+        pattern=re.compile(r"(?<![.!?])[.!?]+(?=\s+[А-ЯЁA-Z«\"\'(])"),
+        is_boundary=True,
+        priority=50,
+        description="Sentence end + capital letter",
+    ),
+    # Sentence end at paragraph boundary
+    SegmentationRule(
+        name="paragraph_end",
+        pattern=re.compile(r"(?<![.!?])[.!?]+(?=\s*\n\s*\n)"),
+        is_boundary=True,
+        priority=45,
+        description="Sentence end + paragraph break",
+    ),
+    # Question or exclamation with space (even without capital)
+    SegmentationRule(
+        name="question_exclamation",
+        pattern=re.compile(r"(?<![.!?])[!?]{1,2}(?=\s)"),
+        is_boundary=True,
+        priority=40,
+        description="Question or exclamation mark",
+    ),
+)
+
+# Priorities are fixed - sort once, not per call
+_SORTED_RULES: Final[tuple[SegmentationRule, ...]] = tuple(
+    sorted(_SEGMENTATION_RULES, key=lambda rule: rule.priority, reverse=True)
+)
+
+# Все граничные правила в одном регулярном выражении: текст сканируется один раз,
+# альтернативы проверяются в порядке приоритета, match.lastgroup - имя правила.
+# Ведущий (?=[.!?]) дает движку префикс-класс для быстрого пропуска прочего текста.
+_BOUNDARY_PATTERN: Final[Pattern[str]] = re.compile(
+    "(?=[.!?])(?:"
+    + "|".join(
+        f"(?P<{rule.name}>{rule.pattern.pattern})" for rule in _SORTED_RULES if rule.is_boundary
+    )
+    + ")"
+)
+
+_INITIALS_PATTERN: Final[Pattern[str]] = re.compile(r"\b[А-ЯЁ]\.\s*(?:[А-ЯЁ]\.\s*)?[А-ЯЁ][а-яё]+\b")
+
+_SENTENCE_END_PATTERN: Final[Pattern[str]] = re.compile(r"[.!?]+\s+[А-ЯЁ«\"\'(]")
+
+_WHITESPACE_PATTERN: Final[Pattern[str]] = re.compile(r"\s*")
+
+
 class SynTagRusPatterns:
     """SynTagRus-based patterns для сегментации предложений."""
 
@@ -151,94 +241,74 @@ class SynTagRusPatterns:
     }
 
     # Объединенный список всех аббревиатур
-    ABBREVIATIONS = HEAD_ABBREVIATIONS | TAIL_ABBREVIATIONS
+    ABBREVIATIONS: frozenset[str] = frozenset(HEAD_ABBREVIATIONS | TAIL_ABBREVIATIONS)
+
+    # Длина самой длинной аббревиатуры - ограничивает просмотр назад от точки
+    _MAX_ABBR_LEN = max(len(abbr) for abbr in ABBREVIATIONS)
 
     # Почетные звания и должности (часто перед ФИО)
-    TITLES = {
-        "президент",
-        "премьер",
-        "министр",
-        "губернатор",
-        "мэр",
-        "директор",
-        "председатель",
-        "генеральный",
-        "академик",
-        "профессор",
-        "доктор",
-        "господин",
-        "госпожа",
-        "товарищ",
-    }
+    TITLES: frozenset[str] = frozenset(
+        {
+            "президент",
+            "премьер",
+            "министр",
+            "губернатор",
+            "мэр",
+            "директор",
+            "председатель",
+            "генеральный",
+            "академик",
+            "профессор",
+            "доктор",
+            "господин",
+            "госпожа",
+            "товарищ",
+        }
+    )
 
     # Слова, после которых часто идет прямая речь
-    SPEECH_VERBS = {
-        "сказал",
-        "сказала",
-        "сказали",
-        "говорил",
-        "говорила",
-        "ответил",
-        "ответила",
-        "спросил",
-        "спросила",
-        "заявил",
-        "заявила",
-        "отметил",
-        "отметила",
-        "подчеркнул",
-        "подчеркнула",
-        "добавил",
-        "добавила",
-        "пояснил",
-        "пояснила",
-        "уточнил",
-        "уточнила",
-    }
-
-    def __init__(self) -> None:
-        """Initialize SynTagRus patterns."""
-        self._compile_patterns()
-
-    def _compile_patterns(self) -> None:
-        """Compile regex patterns for efficient matching."""
-
-        self.rules: list[SegmentationRule] = [
-            # Priority 10: STRONG boundaries
-            # Sentence end followed by capital letter
-            SegmentationRule(
-                name="sentence_end_capital",
-                pattern=re.compile(r"[.!?]+\s+(?=[А-ЯЁ«\"\'(])"),
-                is_boundary=True,
-                priority=50,
-                description="Sentence end + capital letter",
-            ),
-            # Sentence end at paragraph boundary
-            SegmentationRule(
-                name="paragraph_end",
-                pattern=re.compile(r"[.!?]+\s*\n\s*\n"),
-                is_boundary=True,
-                priority=45,
-                description="Sentence end + paragraph break",
-            ),
-            # Question or exclamation with space
-            SegmentationRule(
-                name="question_exclamation",
-                pattern=re.compile(r"[!?]+\s+"),
-                is_boundary=True,
-                priority=40,
-                description="Question or exclamation mark",
-            ),
-        ]
-
-        # Additional compiled patterns for quick checks
-        self.abbr_pattern = re.compile(
-            r"\b(" + "|".join(re.escape(abbr) for abbr in self.ABBREVIATIONS) + r")\."
-        )
-
-        self.initials_pattern = re.compile(r"\b[А-ЯЁ]\.\s*(?:[А-ЯЁ]\.\s*)?[А-ЯЁ][а-яё]+\b")
-
-        self.sentence_end_pattern = re.compile(r"[.!?]+\s+[А-ЯЁ«\"\'(]")
+    SPEECH_VERBS: frozenset[str] = frozenset(
+        {
+            "сказал",
+            "сказала",
+            "сказали",
+            "говорил",
+            "говорила",
+            "ответил",
+            "ответила",
+            "спросил",
+            "спросила",
+            "заявил",
+            "заявила",
+            "отметил",
+            "отметила",
+            "подчеркнул",
+            "подчеркнула",
+            "добавил",
+            "добавила",
+            "пояснил",
+            "пояснила",
+            "уточнил",
+            "уточнила",
+        }
+    )
+
+    # Заглавные буквы кириллицы - то же, что класс [А-ЯЁ] в initials_pattern
+    _UPPER_CYRILLIC = frozenset("АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ")
+
+    # Скомпилированные паттерны строятся один раз при импорте и общие для всех экземпляров
+    rules: tuple[SegmentationRule, ...] = _SEGMENTATION_RULES
+    _sorted_rules: tuple[SegmentationRule, ...] = _SORTED_RULES
+    _boundary_pattern = _BOUNDARY_PATTERN
+
+    # Additional compiled patterns for quick checks
+    # Аббревиатуры собраны в префиксное дерево: движок не перебирает ~90 альтернатив
+    # на каждой позиции, а идет по общим префиксам ("к(?:анд|в|г|м|оп|орп)?" и т.д.)
+    abbr_pattern = re.compile(r"\b(" + _trie_regex(ABBREVIATIONS) + r")\.")
+    initials_pattern = _INITIALS_PATTERN
+    # Глаголы речи одним паттерном: один поиск вместо проверки каждого глагола подстрокой
+    speech_verb_pattern = re.compile(_trie_regex(SPEECH_VERBS))
+    sentence_end_pattern = _SENTENCE_END_PATTERN
 
     def is_abbreviation(self, text: str, pos: int) -> bool:
         """Проверяет, является ли точка перед позицией pos частью аббревиатуры.
@@ -262,12 +332,29 @@ class SynTagRusPatterns:
             return False
 
         # Ищем токен аббревиатуры ПЕРЕД точкой
-        # Извлекаем слово/токен перед точкой
-        before_match = re.search(r"(\w+)\.?$", text[: pos - 1])
-        if not before_match:
+        # Идем назад по символам слова, но не дальше длины самой длинной аббревиатуры:
+        # более длинное слово заведомо не аббревиатура, а срез всего text[:pos] не нужен
+        end = pos - 1
+        if end > 1 and text[end - 1] == ".":
+            end -= 1  # "г.." - допускаем одну лишнюю точку
+        limit = end - self._MAX_ABBR_LEN - 1
+
+        # Обычно перед точкой длинное слово: окно из _MAX_ABBR_LEN + 1 букв отсекаем
+        # одним вызовом isalnum() вместо посимвольного прохода
+        if limit >= 0 and text[limit:end].isalnum():
             return False
 
-        preceding = before_match.group(1).lower()
+        start = end
+        limit = max(0, limit)
+        while start > limit:
+            char = text[start - 1]
+            if not (char.isalnum() or char == "_"):
+                break
+            start -= 1
+        if start == end or end - start > self._MAX_ABBR_LEN:
+            return False
+
+        preceding = text[start:end].lower()
 
         # Проверяем, есть ли в нашем списке аббревиатур
         if preceding not in self.ABBREVIATIONS:
@@ -275,14 +362,15 @@ class SynTagRusPatterns:
 
         # КРИТИЧНО: Проверяем что идет ПОСЛЕ точки
         # Это ключевое улучшение на основе современных практик NLP
-        remaining = text[pos:].lstrip()
+        # Пропускаем пробелы сопоставлением с позиции pos - без копии хвоста text[pos:]
+        next_pos = _WHITESPACE_PATTERN.match(text, pos).end()
 
-        if not remaining:
+        if next_pos == len(text):
             # Конец текста - аббревиатура в конце
             return True
 
         # Проверяем первый символ после пробелов
-        next_char = remaining[0]
+        next_char = text[next_pos]
 
         # УЛУЧШЕНИЕ: Различаем HEAD и TAIL аббревиатуры
         is_head = preceding in self.HEAD_ABBREVIATIONS
@@ -299,7 +387,7 @@ class SynTagRusPatterns:
             # Исключение: инициалы (А. С. Пушкин)
             if is_tail:
                 # Проверяем инициалы: один символ + точка
-                if len(remaining) > 2 and remaining[1] == ".":
+                if len(text) - next_pos > 2 and text[next_pos + 1] == ".":
                     return True  # Часть последовательности инициалов
                 # Иначе это начало нового предложения
                 return False
@@ -323,6 +411,19 @@ class SynTagRusPatterns:
         # Проверяем небольшой контекст: 5 символов до и 10 после
         # Это достаточно для "А. С. Пушкин" но не захватывает далекие инициалы
         start = max(0, pos - 5)
+
+        # Быстрая проверка без regex: паттерн инициалов начинается с "[А-ЯЁ]." не дальше pos,
+        # значит в text[start:pos + 2] должна быть точка сразу после заглавной буквы.
+        # Для подавляющего большинства точек (конец обычного слова) ее нет.
+        upper = self._UPPER_CYRILLIC
+        dot = text.find(".", start + 1, pos + 2)
+        while dot != -1:
+            if text[dot - 1] in upper:
+                break
+            dot = text.find(".", dot + 1, pos + 2)
+        else:
+            return False
+
         end = min(len(text), pos + 10)
         context = text[start:end]
 
@@ -351,42 +452,20 @@ class SynTagRusPatterns:
         Returns:
             List of boundary positions (indices)
         """
-        boundaries = []
-
-        # Find all potential sentence endings
-        for match in re.finditer(r"[.!?]+", text):
-            pos = match.end()
-
-            # Skip if at end of text
-            if pos >= len(text):
-                continue
-
-            # Check what comes after
-            remaining = text[pos:]
+        boundaries: list[int] = []
 
-            # Check if this is a valid boundary
-            is_valid_boundary = False
+        # Атрибуты связываются с локальными переменными один раз, а не на каждом совпадении
+        append = boundaries.append
+        is_blocked = self._is_blocked_boundary
 
-            # Case 1: Followed by whitespace and capital letter (русская ИЛИ латинская)
-            # УЛУЧШЕНИЕ: добавлена поддержка латинских заглавных (для XXI, IV, и т.д.)
-            if re.match(r"\s+[А-ЯЁA-Z«\"\'(]", remaining):
-                is_valid_boundary = True
-
-            # Case 2: Followed by paragraph break
-            elif re.match(r"\s*\n\s*\n", remaining):
-                is_valid_boundary = True
-
-            # Case 3: Question or exclamation (even without capital)
-            elif match.group() in ["!", "?", "!!", "??", "!?", "?!"]:
-                if re.match(r"\s+", remaining):
-                    is_valid_boundary = True
+        # Один проход по тексту; совпадения идут по возрастанию позиции и не пересекаются,
+        # поэтому сортировка и дедупликация не нужны
+        for match in self._boundary_pattern.finditer(text):
+            pos = match.end()
 
             # Check if boundary is blocked by high-priority rules
-            if is_valid_boundary and not self._is_blocked_boundary(text, pos):
-                boundaries.append(pos)
-
-        # Sort and deduplicate
-        boundaries = sorted(set(boundaries))
+            if not is_blocked(text, pos):
+                append(pos)
 
         return boundaries
 
@@ -400,42 +479,37 @@ class SynTagRusPatterns:
         Returns:
             True если граница блокирована
         """
-        # Проверка на аббревиатуру (точка после аббревиатуры)
-        # ВАЖНО: is_abbreviation уже проверяет контекст до И после точки
+        # Аббревиатуры, десятичные числа и многоточие возможны только после точки -
+        # для границ после "!" и "?" эти проверки пропускаются целиком
         if pos > 0 and text[pos - 1] == ".":
+            # Check for ellipsis (...)
+            if pos >= 3 and text[pos - 3 : pos - 1] == "..":
+                return True
+
+            # Check for decimal number (3.14): digit + . + digit
+            if 1 < pos < len(text) and text[pos - 2].isdigit() and text[pos].isdigit():
+                return True
+
+            # Проверка на аббревиатуру (точка после аббревиатуры)
+            # ВАЖНО: is_abbreviation уже проверяет контекст до И после точки
             # Передаем позицию ПОСЛЕ точки (pos), а не позицию точки
             if self.is_abbreviation(text, pos):
                 return True
 
         # Проверка на инициалы (А. С. Пушкин)
+        # Не только после точки: в "А.Пу! Да" граница после "!" тоже попадает в инициалы
         if self.is_initials_context(text, pos):
             return True
 
-        # Check for decimal number (3.14)
-        if pos > 1 and pos < len(text):
-            before_char = text[pos - 2] if pos >= 2 else ""
-            dot_char = text[pos - 1]
-            after_char = text[pos] if pos < len(text) else ""
-
-            # Decimal number pattern: digit + . + digit
-            if before_char.isdigit() and dot_char == "." and after_char.isdigit():
-                return True
-
-        # Check for ellipsis (...)
-        if pos >= 3:
-            if text[pos - 3 : pos] == "...":
-                return True
-
         # Check for direct speech continuation: - сказал он. -
-        if pos > 10:
-            context = text[max(0, pos - 30) : min(len(text), pos + 10)]
-            for verb in self.SPEECH_VERBS:
-                if verb in context.lower():
-                    # Check for pattern: . - word
-                    if pos < len(text) - 3:
-                        after = text[pos : pos + 3]
-                        if after.strip().startswith("-") or after.strip().startswith("—"):
-                            return True
+        # Сначала дешевая проверка тире, затем поиск глагола в контексте (lower один раз)
+        if 10 < pos < len(text) - 3:
+            # Check for pattern: . - word
+            after = text[pos : pos + 3].strip()
+            if after.startswith(("-", "—")):
+                context = text[max(0, pos - 30) : pos + 10].lower()
+                if self.speech_verb_pattern.search(context):
+                    return True
 
         return False
 
@@ -456,21 +530,20 @@ class SynTagRusPatterns:
         penalties = 0
 
         # Check for common errors
-        sentences = self._split_by_boundaries(text, boundaries)
-
-        for sent in sentences:
-            sent = sent.strip()
+        # Работаем с позициями: строка предложения нужна только для проверки аббревиатуры
+        for start, stop in self._iter_sentence_spans(text, boundaries):
+            length = stop - start
 
             # Too short sentence (likely error)
-            if len(sent) < 3:
+            if length < 3:
                 penalties += 0.1
 
             # Starts with lowercase (likely error)
-            if sent and sent[0].islower():
+            if text[start].islower():
                 penalties += 0.15
 
             # Contains only abbreviation
-            if len(sent) < 10 and self.abbr_pattern.search(sent):
+            if length < 10 and self.abbr_pattern.search(text[start:stop]):
                 penalties += 0.2
 
         # Apply penalties
@@ -478,50 +551,53 @@ class SynTagRusPatterns:
 
         return score
 
-    def _split_by_boundaries(self, text: str, boundaries: list[int]) -> list[str]:
-        """Splits text by boundaries.
+    def _iter_sentence_spans(self, text: str, boundaries: list[int]) -> Iterator[tuple[int, int]]:
+        """Iterates sentence spans between boundaries, without surrounding whitespace.
 
         Args:
             text: Text to split
             boundaries: Boundary positions
 
-        Returns:
-            List of sentences
+        Yields:
+            (start, stop) of each non-empty sentence
         """
-        sentences = []
+        size = len(text)
         start = 0
 
-        for boundary in boundaries:
-            sentence = text[start:boundary].strip()
-            if sentence:
-                sentences.append(sentence)
+        # Last sentence ends at the end of text
+        for boundary in [*boundaries, size]:
+            lo = start
+            hi = min(boundary, size)
+            while lo < hi and text[lo].isspace():
+                lo += 1
+            while lo < hi and text[hi - 1].isspace():
+                hi -= 1
+            if lo < hi:
+                yield lo, hi
             start = boundary
 
-        # Last sentence
-        if start < len(text):
-            sentence = text[start:].strip()
-            if sentence:
-                sentences.append(sentence)
-
-        return sentences
+    def _split_by_boundaries(self, text: str, boundaries: list[int]) -> list[str]:
+        """Splits text by boundaries.
 
+        Args:
+            text: Text to split
+            boundaries: Boundary positions
 
-# Global instance for efficiency
-_global_patterns: SynTagRusPatterns | None = None
+        Returns:
+            List of sentences
+        """
+        return [text[start:stop] for start, stop in self._iter_sentence_spans(text, boundaries)]
 
 
+# Global instance for efficiency
+@functools.cache
 def get_syntagrus_patterns() -> SynTagRusPatterns:
     """Get global SynTagRus patterns instance.
 
     Returns:
         SynTagRusPatterns instance
     """
-    global _global_patterns
-
-    if _global_patterns is None:
-        _global_patterns = SynTagRusPatterns()
-
-    return _global_patterns
+    return SynTagRusPatterns()
 
 
 __all__ = ["SynTagRusPatterns", "get_syntagrus_patterns", "SegmentationRule"]
@@ -17,10 +17,21 @@ if __name__ == "__main__":
 from razdel import sentenize as rsentenize
 from razdel import tokenize as rtokenize
 
-from mawo_razdel import sentenize, tokenize
+from mawo_razdel import Substring, sentenize, tokenize
+from mawo_razdel.syntagrus_patterns import get_syntagrus_patterns
 
+# Один экземпляр паттернов на все случаи - без повторной инициализации между ними
+_patterns = get_syntagrus_patterns()
 
-def test_case(name, text, func_razdel, func_mawo, expected=None, verbose=False):
+
+def syntagrus_sentenize(text):
+    """Сегментация SynTagRus-паттернами на общем экземпляре _patterns"""
+    boundaries = _patterns.find_sentence_boundaries(text)
+    for start, stop in _patterns._iter_sentence_spans(text, boundaries):
+        yield Substring(start, stop, text[start:stop])
+
+
+def test_case(name, text, func_razdel, func_mawo, expected=None, verbose=False, func_extra=None):
     """Тестовый случай"""
     razdel_res = list(func_razdel(text))
     mawo_res = list(func_mawo(text))
@@ -42,167 +53,110 @@ def test_case(name, text, func_razdel, func_mawo, expected=None, verbose=False):
     if verbose or not match:
         print(f"   Razdel: {razdel_texts}")
         print(f"   Mawo:   {mawo_texts}")
+        if func_extra:
+            print(f"   SynTagRus: {[v.text for v in func_extra(text)]}")
         if expected:
             print(f"   Ожидается: {expected}")
 
     return match or better
 
 
-print("=" * 80)
-print("ТЕСТЫ ТОКЕНИЗАЦИИ")
-print("=" * 80)
+# (название, текст, verbose)
+TOKENIZE_CASES = [
+    # Десятичные числа
+    ("Десятичное число (точка)", "Число π ≈ 3.14159", True),
+    ("Десятичное число (запятая)", "Цена 3,50 руб.", True),
+    # Дроби
+    ("Дробь", "Половина - это 1/2", True),
+    # Процент
+    ("Процент", "Рост составил 95.5%", True),
+    # Диапазоны
+    ("Диапазон годов", "Период 1995-1999 гг.", True),
+    # Время
+    ("Время", "Встреча в 10:30", True),
+]
+
+SENTENIZE_CASES = [
+    # Аббревиатуры
+    ("Год (г.)", "Он родился в 1799 г. в Москве.", False),
+    ("Инициалы", "А. С. Пушкин - великий русский поэт.", False),
+    ("Адрес", "Москва, ул. Тверская, д. 1. XXI век.", True),
+    (
+        "Комплексный текст",
+        """Москва, ул. Тверская, д. 1. XXI век.
+А. С. Пушкин родился в 1799 г. в Москве.""",
+        True,
+    ),
+    # Сложные случаи
+    ("Город + название", "Я живу в г. Москва с 2020 г. Здесь хорошо.", True),
+    ("Профессор", "Лекцию читал проф. Иванов из МГУ. Было интересно.", True),
+    ("Несколько аббревиатур", "Адрес: г. Москва, ул. Тверская, д. 5, кв. 10.", True),
+    ("Век римскими цифрами", "В XX в. произошло много событий. В XXI в. тоже.", True),
+    ("Время с аббревиатурой", "Встреча в 10 ч. 30 мин. Не опаздывайте.", True),
+    ("Деньги", "Цена 100 руб. 50 коп. за штуку. Дешево.", True),
+    # Edge cases
+    ("Точка в конце строки", "Это предложение.", False),
+    ("Множественные точки", "Первое. Второе. Третье.", False),
+    ("Восклицательный знак", "Привет! Как дела? Всё хорошо.", False),
+    (
+        "Многострочный текст",
+        """Первое предложение.
 
-results = []
+Второе предложение после пустой строки.""",
+        True,
+    ),
+    # Научный текст
+    (
+        "Научный текст",
+        "Согласно исследованию проф. Петрова и др., температура составила 25.5°C. Это важный результат.",
+        True,
+    ),
+]
 
-# Десятичные числа
-results.append(
-    test_case("Десятичное число (точка)", "Число π ≈ 3.14159", rtokenize, tokenize, verbose=True)
-)
 
-results.append(
-    test_case("Десятичное число (запятая)", "Цена 3,50 руб.", rtokenize, tokenize, verbose=True)
-)
+def main():
+    print("=" * 80)
+    print("ТЕСТЫ ТОКЕНИЗАЦИИ")
+    print("=" * 80)
 
-# Дроби
-results.append(test_case("Дробь", "Половина - это 1/2", rtokenize, tokenize, verbose=True))
+    results = []
 
-# Процент
-results.append(test_case("Процент", "Рост составил 95.5%", rtokenize, tokenize, verbose=True))
+    for name, text, verbose in TOKENIZE_CASES:
+        results.append(test_case(name, text, rtokenize, tokenize, verbose=verbose))
 
-# Диапазоны
-results.append(
-    test_case("Диапазон годов", "Период 1995-1999 гг.", rtokenize, tokenize, verbose=True)
-)
+    print("\n" + "=" * 80)
+    print("ТЕСТЫ СЕГМЕНТАЦИИ")
+    print("=" * 80)
 
-# Время
-results.append(test_case("Время", "Встреча в 10:30", rtokenize, tokenize, verbose=True))
+    for name, text, verbose in SENTENIZE_CASES:
+        results.append(
+            test_case(
+                name,
+                text,
+                rsentenize,
+                sentenize,
+                verbose=verbose,
+                func_extra=syntagrus_sentenize,
+            )
+        )
 
-print("\n" + "=" * 80)
-print("ТЕСТЫ СЕГМЕНТАЦИИ")
-print("=" * 80)
+    print("\n" + "=" * 80)
+    print("ИТОГОВАЯ СТАТИСТИКА")
+    print("=" * 80)
 
-# Аббревиатуры
-results.append(test_case("Год (г.)", "Он родился в 1799 г. в Москве.", rsentenize, sentenize))
+    total = len(results)
+    passed = sum(results)
+    failed = total - passed
 
-results.append(test_case("Инициалы", "А. С. Пушкин - великий русский поэт.", rsentenize, sentenize))
+    print(f"Всего тестов: {total}")
+    print(f"Пройдено: {passed} ({100*passed//total}%)")
+    print(f"Не пройдено: {failed}")
 
-results.append(
-    test_case("Адрес", "Москва, ул. Тверская, д. 1. XXI век.", rsentenize, sentenize, verbose=True)
-)
+    if failed == 0:
+        print("\n🎉 ВСЕ ТЕСТЫ ПРОЙДЕНЫ! Библиотека работает корректно!")
+    else:
+        print(f"\n⚠️  Нужно исправить {failed} тест(ов)")
 
-results.append(
-    test_case(
-        "Комплексный текст",
-        """Москва, ул. Тверская, д. 1. XXI век.
-А. С. Пушкин родился в 1799 г. в Москве.""",
-        rsentenize,
-        sentenize,
-        verbose=True,
-    )
-)
-
-# Сложные случаи
-results.append(
-    test_case(
-        "Город + название",
-        "Я живу в г. Москва с 2020 г. Здесь хорошо.",
-        rsentenize,
-        sentenize,
-        verbose=True,
-    )
-)
-
-results.append(
-    test_case(
-        "Профессор",
-        "Лекцию читал проф. Иванов из МГУ. Было интересно.",
-        rsentenize,
-        sentenize,
-        verbose=True,
-    )
-)
-
-results.append(
-    test_case(
-        "Несколько аббревиатур",
-        "Адрес: г. Москва, ул. Тверская, д. 5, кв. 10.",
-        rsentenize,
-        sentenize,
-        verbose=True,
-    )
-)
-
-results.append(
-    test_case(
-        "Век римскими цифрами",
-        "В XX в. произошло много событий. В XXI в. тоже.",
-        rsentenize,
-        sentenize,
-        verbose=True,
-    )
-)
-
-results.append(
-    test_case(
-        "Время с аббревиатурой",
-        "Встреча в 10 ч. 30 мин. Не опаздывайте.",
-        rsentenize,
-        sentenize,
-        verbose=True,
-    )
-)
-
-results.append(
-    test_case(
-        "Деньги", "Цена 100 руб. 50 коп. за штуку. Дешево.", rsentenize, sentenize, verbose=True
-    )
-)
-
-# Edge cases
-results.append(test_case("Точка в конце строки", "Это предложение.", rsentenize, sentenize))
-
-results.append(test_case("Множественные точки", "Первое. Второе. Третье.", rsentenize, sentenize))
-
-results.append(
-    test_case("Восклицательный знак", "Привет! Как дела? Всё хорошо.", rsentenize, sentenize)
-)
-
-results.append(
-    test_case(
-        "Многострочный текст",
-        """Первое предложение.
 
-Второе предложение после пустой строки.""",
-        rsentenize,
-        sentenize,
-        verbose=True,
-    )
-)
-
-# Научный текст
-results.append(
-    test_case(
-        "Научный текст",
-        "Согласно исследованию проф. Петрова и др., температура составила 25.5°C. Это важный результат.",
-        rsentenize,
-        sentenize,
-        verbose=True,
-    )
-)
-
-print("\n" + "=" * 80)
-print("ИТОГОВАЯ СТАТИСТИКА")
-print("=" * 80)
-
-total = len(results)
-passed = sum(results)
-failed = total - passed
-
-print(f"Всего тестов: {total}")
-print(f"Пройдено: {passed} ({100*passed//total}%)")
-print(f"Не пройдено: {failed}")
-
-if failed == 0:
-    print("\n🎉 ВСЕ ТЕСТЫ ПРОЙДЕНЫ! Библиотека работает корректно!")
-else:
-    print(f"\n⚠️  Нужно исправить {failed} тест(ов)")
+if __name__ == "__main__":
+    main()
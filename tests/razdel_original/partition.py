@@ -1,9 +1,6 @@
-import re
-
 from mawo_razdel import Substring
 
 FILL = " "
-FILL_PATTERN = re.compile(r"^\s*$")
 
 
 class Record:
@@ -28,7 +25,10 @@ class Record:
 class Partition(Record):
     __attributes__ = ["chunks"]
 
-    is_fill = FILL_PATTERN.match
+    @staticmethod
+    def is_fill(chunk):
+        # То же, что re.match(r"^\s*$", chunk), но без regex
+        return not chunk or chunk.isspace()
 
     def __init__(self, chunks):
         self.chunks = chunks
@@ -53,12 +53,18 @@ class Partition(Record):
 
 
 def substring_chunks(substrings, fill=FILL):
-    previous = 0
-    for index, substring in enumerate(substrings):
-        if index > 0:
-            size = substring.start - previous
-            if size:
-                yield fill * size
+    substrings = iter(substrings)
+    substring = next(substrings, None)
+    if substring is None:
+        return
+
+    # Первый substring без заполнителя перед ним - дальше цикл без проверки индекса
+    yield substring.text
+    previous = substring.stop
+    for substring in substrings:
+        size = substring.start - previous
+        if size:
+            yield fill * size
         yield substring.text
         previous = substring.stop
 